@@ -7,8 +7,9 @@ This module provides:
 - Common utilities used across the connector
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from datetime import datetime, timezone
+from itertools import islice
 import re
 
 
@@ -178,6 +179,14 @@ class NotionConfigurationError(Exception):
 # =============================================================================
 
 
+# Shared UTC tzinfo attached to naive datetimes
+_UTC = timezone.utc
+
+# strptime fallback for fractional seconds that are not 3 or 6 digits long,
+# which fromisoformat rejects before Python 3.11
+_ISO_FRACTION_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
 def parse_iso_datetime(date_string: Optional[str]) -> Optional[datetime]:
     """
     Parse an ISO 8601 datetime string into a datetime object.
@@ -186,24 +195,28 @@ def parse_iso_datetime(date_string: Optional[str]) -> Optional[datetime]:
         date_string: ISO 8601 formatted datetime string
 
     Returns:
-        Parsed datetime object or None if input is None/empty
+        Parsed datetime object or None if input is None/empty. Values without
+        an offset (including date-only strings) are treated as UTC.
     """
     if not date_string:
         return None
 
-    # Handle various ISO 8601 formats
+    # fromisoformat is implemented in C; it only needs the "Z" suffix spelled
+    # as an offset
+    if date_string.endswith("Z"):
+        date_string = date_string[:-1] + "+00:00"
     try:
-        # Try parsing with timezone
-        if date_string.endswith("Z"):
-            date_string = date_string[:-1] + "+00:00"
-        return datetime.fromisoformat(date_string)
+        parsed = datetime.fromisoformat(date_string)
     except ValueError:
-        # Try simpler format
         try:
-            return datetime.strptime(date_string, "%Y-%m-%d")
+            parsed = datetime.strptime(date_string, _ISO_FRACTION_FORMAT)
         except ValueError:
             return None
 
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_UTC)
+    return parsed
+
 
 def format_datetime_for_api(dt: Optional[datetime]) -> Optional[str]:
     """
@@ -220,7 +233,7 @@ def format_datetime_for_api(dt: Optional[datetime]) -> Optional[str]:
 
     # Ensure timezone awareness
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=_UTC)
 
     return dt.isoformat()
 
@@ -238,10 +251,8 @@ def extract_plain_text(rich_text_array: List[Dict[str, Any]]) -> str:
     if not rich_text_array:
         return ""
 
-    return "".join(
-        item.get("plain_text", "")
-        for item in rich_text_array
-    )
+    # str.join builds a list from its argument anyway, so hand it one directly
+    return "".join([item.get("plain_text", "") for item in rich_text_array])
 
 
 def extract_title(title_property: List[Dict[str, Any]]) -> str:
@@ -257,6 +268,10 @@ def extract_title(title_property: List[Dict[str, Any]]) -> str:
     return extract_plain_text(title_property)
 
 
+# Translation table that deletes dashes from Notion IDs
+_STRIP_DASH = str.maketrans("", "", "-")
+
+
 def normalize_notion_id(notion_id: str) -> str:
     """
     Normalize a Notion ID by removing dashes if present.
@@ -271,7 +286,10 @@ def normalize_notion_id(notion_id: str) -> str:
     Returns:
         ID without dashes
     """
-    return notion_id.replace("-", "")
+    # Already-normalized IDs (the common case) are returned untouched
+    if not notion_id or "-" not in notion_id:
+        return notion_id
+    return notion_id.translate(_STRIP_DASH)
 
 
 def format_notion_id(notion_id: str) -> str:
@@ -284,14 +302,86 @@ def format_notion_id(notion_id: str) -> str:
     Returns:
         ID formatted as UUID with dashes
     """
+    # Already in UUID form: nothing to rebuild
+    if (
+        len(notion_id) == 36
+        and notion_id[8] == notion_id[13] == notion_id[18] == notion_id[23] == "-"
+    ):
+        return notion_id
+
     # Remove existing dashes
-    clean_id = notion_id.replace("-", "")
+    clean_id = normalize_notion_id(notion_id)
+
+    if len(clean_id) != 32:
+        return notion_id  # Return as-is if not standard length
 
     # Format as UUID
-    if len(clean_id) == 32:
-        return f"{clean_id[:8]}-{clean_id[8:12]}-{clean_id[12:16]}-{clean_id[16:20]}-{clean_id[20:]}"
+    return f"{clean_id[:8]}-{clean_id[8:12]}-{clean_id[12:16]}-{clean_id[16:20]}-{clean_id[20:]}"
 
-    return notion_id  # Return as-is if not standard length
+
+def _extract_date(property_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract a date property as its start/end/time_zone parts."""
+    date_data = property_data.get("date")
+    if date_data:
+        return {
+            "start": date_data.get("start"),
+            "end": date_data.get("end"),
+            "time_zone": date_data.get("time_zone")
+        }
+    return None
+
+
+def _extract_files(property_data: Dict[str, Any]) -> List[Optional[str]]:
+    """Extract the URLs of external and uploaded files."""
+    files = []
+    for file_obj in property_data.get("files", []):
+        file_type = file_obj.get("type")
+        if file_type == "external":
+            files.append(file_obj.get("external", {}).get("url"))
+        elif file_type == "file":
+            files.append(file_obj.get("file", {}).get("url"))
+    return files
+
+
+def _extract_typed_value(property_data: Dict[str, Any], key: str) -> Any:
+    """Extract a formula or rollup value, nested under its result type."""
+    typed_data = property_data.get(key, {})
+    return typed_data.get(typed_data.get("type"))
+
+
+def _extract_unique_id(property_data: Dict[str, Any]) -> str:
+    """Extract a unique ID as "PREFIX-number", or just the number."""
+    unique_id_data = property_data.get("unique_id", {})
+    prefix = unique_id_data.get("prefix", "")
+    number = unique_id_data.get("number", "")
+    return f"{prefix}-{number}" if prefix else str(number)
+
+
+def _extract_name(property_data: Dict[str, Any], key: str) -> Optional[str]:
+    """Extract the option name of a select or status property."""
+    option = property_data.get(key)
+    return option.get("name") if option else None
+
+
+# Extractors for property types whose value needs reshaping. Every other type
+# (number, checkbox, url, email, phone_number, created_time, last_edited_time,
+# verification and unknown types) is returned as stored under its type key.
+_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "title": lambda p: extract_plain_text(p.get("title", [])),
+    "rich_text": lambda p: extract_plain_text(p.get("rich_text", [])),
+    "select": lambda p: _extract_name(p, "select"),
+    "status": lambda p: _extract_name(p, "status"),
+    "multi_select": lambda p: [item.get("name") for item in p.get("multi_select", [])],
+    "date": _extract_date,
+    "people": lambda p: [person.get("id") for person in p.get("people", [])],
+    "relation": lambda p: [rel.get("id") for rel in p.get("relation", [])],
+    "files": _extract_files,
+    "formula": lambda p: _extract_typed_value(p, "formula"),
+    "rollup": lambda p: _extract_typed_value(p, "rollup"),
+    "created_by": lambda p: p.get("created_by", {}).get("id"),
+    "last_edited_by": lambda p: p.get("last_edited_by", {}).get("id"),
+    "unique_id": _extract_unique_id,
+}
 
 
 def extract_property_value(property_data: Dict[str, Any]) -> Any:
@@ -311,99 +401,12 @@ def extract_property_value(property_data: Dict[str, Any]) -> Any:
         return None
 
     prop_type = property_data.get("type")
+    extractor = _EXTRACTORS.get(prop_type)
+    if extractor is not None:
+        return extractor(property_data)
 
-    if prop_type == "title":
-        return extract_plain_text(property_data.get("title", []))
-
-    elif prop_type == "rich_text":
-        return extract_plain_text(property_data.get("rich_text", []))
-
-    elif prop_type == "number":
-        return property_data.get("number")
-
-    elif prop_type == "select":
-        select_data = property_data.get("select")
-        return select_data.get("name") if select_data else None
-
-    elif prop_type == "multi_select":
-        return [item.get("name") for item in property_data.get("multi_select", [])]
-
-    elif prop_type == "date":
-        date_data = property_data.get("date")
-        if date_data:
-            return {
-                "start": date_data.get("start"),
-                "end": date_data.get("end"),
-                "time_zone": date_data.get("time_zone")
-            }
-        return None
-
-    elif prop_type == "people":
-        return [person.get("id") for person in property_data.get("people", [])]
-
-    elif prop_type == "files":
-        files = []
-        for file_obj in property_data.get("files", []):
-            file_type = file_obj.get("type")
-            if file_type == "external":
-                files.append(file_obj.get("external", {}).get("url"))
-            elif file_type == "file":
-                files.append(file_obj.get("file", {}).get("url"))
-        return files
-
-    elif prop_type == "checkbox":
-        return property_data.get("checkbox")
-
-    elif prop_type == "url":
-        return property_data.get("url")
-
-    elif prop_type == "email":
-        return property_data.get("email")
-
-    elif prop_type == "phone_number":
-        return property_data.get("phone_number")
-
-    elif prop_type == "formula":
-        formula_data = property_data.get("formula", {})
-        formula_type = formula_data.get("type")
-        return formula_data.get(formula_type)
-
-    elif prop_type == "relation":
-        return [rel.get("id") for rel in property_data.get("relation", [])]
-
-    elif prop_type == "rollup":
-        rollup_data = property_data.get("rollup", {})
-        rollup_type = rollup_data.get("type")
-        return rollup_data.get(rollup_type)
-
-    elif prop_type == "created_time":
-        return property_data.get("created_time")
-
-    elif prop_type == "created_by":
-        return property_data.get("created_by", {}).get("id")
-
-    elif prop_type == "last_edited_time":
-        return property_data.get("last_edited_time")
-
-    elif prop_type == "last_edited_by":
-        return property_data.get("last_edited_by", {}).get("id")
-
-    elif prop_type == "status":
-        status_data = property_data.get("status")
-        return status_data.get("name") if status_data else None
-
-    elif prop_type == "unique_id":
-        unique_id_data = property_data.get("unique_id", {})
-        prefix = unique_id_data.get("prefix", "")
-        number = unique_id_data.get("number", "")
-        return f"{prefix}-{number}" if prefix else str(number)
-
-    elif prop_type == "verification":
-        return property_data.get("verification")
-
-    else:
-        # Return raw data for unknown types
-        return property_data.get(prop_type)
+    # Value is stored directly under the type key (also covers unknown types)
+    return property_data.get(prop_type)
 
 
 def flatten_properties(properties: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
@@ -416,10 +419,26 @@ def flatten_properties(properties: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Flattened dictionary with property names as keys
     """
-    return {
-        name: extract_property_value(prop_data)
-        for name, prop_data in properties.items()
-    }
+    flattened = {}
+    for name, prop_data in properties.items():
+        prop_type = prop_data.get("type") if prop_data else None
+
+        # Inline the most common property types to save a call per property
+        if prop_type == "title" or prop_type == "rich_text":
+            # Same join as extract_plain_text, without the extra call
+            spans = prop_data.get(prop_type)
+            flattened[name] = (
+                "".join([span.get("plain_text", "") for span in spans]) if spans else ""
+            )
+        elif prop_type == "number":
+            flattened[name] = prop_data.get("number")
+        elif prop_type == "select":
+            select_data = prop_data.get("select")
+            flattened[name] = select_data.get("name") if select_data else None
+        else:
+            flattened[name] = extract_property_value(prop_data)
+
+    return flattened
 
 
 def build_filter_condition(
@@ -448,18 +467,24 @@ def build_filter_condition(
     }
 
 
-def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
+def chunk_list(items: Iterable[Any], chunk_size: int) -> List[List[Any]]:
     """
-    Split a list into chunks of specified size.
+    Split a list (or any iterable) into chunks of specified size.
 
     Args:
-        items: List to split
+        items: List or iterable to split
         chunk_size: Maximum size of each chunk
 
     Returns:
         List of chunks
+
+    Raises:
+        ValueError: If chunk_size is not positive
     """
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    it = iter(items)
+    return list(iter(lambda: list(islice(it, chunk_size)), []))
 
 
 def safe_get_nested(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
@@ -476,10 +501,9 @@ def safe_get_nested(data: Dict[str, Any], *keys: str, default: Any = None) -> An
     """
     current = data
     for key in keys:
-        if isinstance(current, dict):
-            current = current.get(key)
-        else:
+        if not isinstance(current, dict):
             return default
+        current = current.get(key)
         if current is None:
             return default
     return current
@@ -4,16 +4,55 @@ Shared pytest fixtures for Notion connector tests.
 
 import json
 import os
+import re
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import MagicMock, Mock, patch
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+from urllib.parse import urlsplit
 
 import pytest
+import requests
 import responses
-
-# Ensure the src module is importable
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from requests.adapters import HTTPAdapter
+
+# Ensure the src module is importable; test modules rely on this insert
+_SOURCE_ROOT = str(Path(__file__).parent.parent)
+if _SOURCE_ROOT not in sys.path:
+    sys.path.insert(0, _SOURCE_ROOT)
+
+
+def pytest_addoption(parser):
+    """Register Notion test suite command line options."""
+    parser.addoption(
+        "--fast-mocks",
+        action="store_true",
+        default=False,
+        help=(
+            "Serve mocked_responses registrations from the in-memory "
+            "MockTransport instead of the responses library."
+        ),
+    )
+    parser.addoption(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Do not read or write .pytest_cache (same as -p no:cacheprovider). "
+            "Also enabled by PYTEST_DISABLE_CACHE=1."
+        ),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Block the cache provider when the on-disk cache is disabled."""
+    if config.getoption("--no-cache") or os.environ.get("PYTEST_DISABLE_CACHE") == "1":
+        # The cache provider has already configured itself by the time a
+        # conftest runs, so its lastfailed/newfirst writers are dropped too.
+        for name in ("cacheprovider", "lfplugin", "nfplugin", "stepwise"):
+            config.pluginmanager.set_blocked(name)
 
 
 # =============================================================================
@@ -30,35 +69,40 @@ def load_fixture(relative_path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+# Fixture data and config objects below are session-scoped: they are loaded
+# once and shared by every test, so tests must treat them as read-only and
+# take a copy.deepcopy() before mutating.
+
+
 # =============================================================================
 # Auth Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_token_credentials() -> Dict[str, Any]:
     """Load valid token credentials."""
     return load_fixture("auth/valid_token_credentials.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_token_credentials_legacy() -> Dict[str, Any]:
     """Load valid legacy token credentials."""
     return load_fixture("auth/valid_token_credentials_legacy.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_oauth2_credentials() -> Dict[str, Any]:
     """Load valid OAuth2 credentials."""
     return load_fixture("auth/valid_oauth2_credentials.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_token_credentials() -> Dict[str, Any]:
     """Load invalid token credentials."""
     return load_fixture("auth/invalid_token_credentials.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expired_oauth2_credentials() -> Dict[str, Any]:
     """Load expired OAuth2 credentials."""
     return load_fixture("auth/expired_oauth2_credentials.json")
@@ -68,67 +112,67 @@ def expired_oauth2_credentials() -> Dict[str, Any]:
 # Response Fixtures - Success
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_me_bot_response() -> Dict[str, Any]:
     """Load user/me bot response."""
     return load_fixture("responses/success/user_me_bot.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def users_list_response() -> Dict[str, Any]:
     """Load users list response."""
     return load_fixture("responses/success/users_list.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_person_response() -> Dict[str, Any]:
     """Load person user response."""
     return load_fixture("responses/success/user_person.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def databases_list_response() -> Dict[str, Any]:
     """Load databases list response."""
     return load_fixture("responses/success/databases_list.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def database_full_response() -> Dict[str, Any]:
     """Load single database response."""
     return load_fixture("responses/success/database_full.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pages_list_response() -> Dict[str, Any]:
     """Load pages list response."""
     return load_fixture("responses/success/pages_list.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def page_full_response() -> Dict[str, Any]:
     """Load single page response."""
     return load_fixture("responses/success/page_full.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blocks_list_response() -> Dict[str, Any]:
     """Load blocks list response."""
     return load_fixture("responses/success/blocks_list.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def block_single_response() -> Dict[str, Any]:
     """Load single block response."""
     return load_fixture("responses/success/block_single.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comments_list_response() -> Dict[str, Any]:
     """Load comments list response."""
     return load_fixture("responses/success/comments_list.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def search_results_response() -> Dict[str, Any]:
     """Load search results response."""
     return load_fixture("responses/success/search_results.json")
@@ -138,29 +182,105 @@ def search_results_response() -> Dict[str, Any]:
 # Response Fixtures - Errors
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_401_response() -> Dict[str, Any]:
     """Load 401 unauthorized error response."""
     return load_fixture("responses/errors/401_unauthorized.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_403_response() -> Dict[str, Any]:
     """Load 403 forbidden error response."""
     return load_fixture("responses/errors/403_forbidden.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_429_response() -> Dict[str, Any]:
     """Load 429 rate limited error response."""
     return load_fixture("responses/errors/429_rate_limited.json")
 
 
+# =============================================================================
+# Encoded Response Body Fixtures
+# =============================================================================
+#
+# Pre-encoded JSON bodies for responses.add(body=..., content_type=JSON_CONTENT_TYPE)
+# and mock_http routes, so the fixture dicts are serialized once per session
+# rather than per test.
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+def encode_json_body(data: Dict[str, Any]) -> bytes:
+    """Encode a fixture dict as a JSON response body."""
+    return json.dumps(data).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def user_me_bot_body(user_me_bot_response) -> bytes:
+    """Encoded user/me bot response body."""
+    return encode_json_body(user_me_bot_response)
+
+
+@pytest.fixture(scope="session")
+def users_list_body(users_list_response) -> bytes:
+    """Encoded users list response body."""
+    return encode_json_body(users_list_response)
+
+
+@pytest.fixture(scope="session")
+def user_person_body(user_person_response) -> bytes:
+    """Encoded user person response body."""
+    return encode_json_body(user_person_response)
+
+
+@pytest.fixture(scope="session")
+def databases_list_body(databases_list_response) -> bytes:
+    """Encoded databases list response body."""
+    return encode_json_body(databases_list_response)
+
+
+@pytest.fixture(scope="session")
+def pages_list_body(pages_list_response) -> bytes:
+    """Encoded pages list response body."""
+    return encode_json_body(pages_list_response)
+
+
+@pytest.fixture(scope="session")
+def page_full_body(page_full_response) -> bytes:
+    """Encoded full page response body."""
+    return encode_json_body(page_full_response)
+
+
+@pytest.fixture(scope="session")
+def blocks_list_body(blocks_list_response) -> bytes:
+    """Encoded blocks list response body."""
+    return encode_json_body(blocks_list_response)
+
+
+@pytest.fixture(scope="session")
+def comments_list_body(comments_list_response) -> bytes:
+    """Encoded comments list response body."""
+    return encode_json_body(comments_list_response)
+
+
+@pytest.fixture(scope="session")
+def error_401_body(error_401_response) -> bytes:
+    """Encoded 401 unauthorized error response body."""
+    return encode_json_body(error_401_response)
+
+
+@pytest.fixture(scope="session")
+def error_403_body(error_403_response) -> bytes:
+    """Encoded 403 forbidden error response body."""
+    return encode_json_body(error_403_response)
+
+
 # =============================================================================
 # Configuration Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token_config(valid_token_credentials) -> Dict[str, Any]:
     """Create a complete token configuration."""
     return {
@@ -174,7 +294,7 @@ def token_config(valid_token_credentials) -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oauth2_config(valid_oauth2_credentials) -> Dict[str, Any]:
     """Create a complete OAuth2 configuration."""
     return {
@@ -192,13 +312,48 @@ def oauth2_config(valid_oauth2_credentials) -> Dict[str, Any]:
 # Connector Instance Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def notion_config(token_config):
     """Create NotionConfig instance."""
     from src.config import NotionConfig
     return NotionConfig(**token_config)
 
 
+@pytest.fixture(scope="session")
+def _notion_client(notion_config):
+    """Create a NotionClient instance shared across the session."""
+    from src.client import NotionClient
+    return NotionClient(notion_config)
+
+
+@pytest.fixture
+def notion_client(_notion_client):
+    """Shared NotionClient, with the rate limiter state of a freshly built client."""
+    _notion_client.rate_limiter.reset()
+    return _notion_client
+
+
+@pytest.fixture(scope="session")
+def users_stream(_notion_client, notion_config):
+    """Create a UsersStream on the shared client."""
+    from src.streams import UsersStream
+    return UsersStream(_notion_client, notion_config)
+
+
+@pytest.fixture(scope="session")
+def databases_stream(_notion_client, notion_config):
+    """Create a DatabasesStream on the shared client."""
+    from src.streams import DatabasesStream
+    return DatabasesStream(_notion_client, notion_config)
+
+
+@pytest.fixture(scope="session")
+def pages_stream(_notion_client, notion_config):
+    """Create a PagesStream on the shared client."""
+    from src.streams import PagesStream
+    return PagesStream(_notion_client, notion_config)
+
+
 @pytest.fixture
 def notion_connector(notion_config):
     """Create NotionSourceConnector instance."""
@@ -206,6 +361,49 @@ def notion_connector(notion_config):
     return NotionSourceConnector(notion_config)
 
 
+# =============================================================================
+# Discovery Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def discovered_catalog(notion_config) -> Dict[str, Any]:
+    """Run discover() once for the default config and share the catalog message."""
+    from src.connector import NotionSourceConnector
+    return NotionSourceConnector(notion_config).discover()
+
+
+@pytest.fixture(scope="session")
+def streams_by_name(discovered_catalog) -> Dict[str, Dict[str, Any]]:
+    """Index the discovered catalog's streams by stream name."""
+    return {s["name"]: s for s in discovered_catalog["catalog"]["streams"]}
+
+
+@pytest.fixture(scope="session")
+def stream_schemas(_notion_client, notion_config) -> Dict[type, Dict[str, Any]]:
+    """Build each stream class's JSON schema once, keyed by stream class."""
+    from src.streams import AVAILABLE_STREAMS
+    return {
+        stream_cls: stream_cls(_notion_client, notion_config).get_json_schema()
+        for stream_cls in AVAILABLE_STREAMS.values()
+    }
+
+
+@pytest.fixture(scope="session")
+def full_catalog():
+    """Create a StreamCatalog covering every stream class."""
+    from src.connector import StreamCatalog
+    from src.streams import (
+        UsersStream,
+        DatabasesStream,
+        PagesStream,
+        BlocksStream,
+        CommentsStream,
+    )
+    return StreamCatalog.from_streams(
+        [UsersStream, DatabasesStream, PagesStream, BlocksStream, CommentsStream]
+    )
+
+
 # =============================================================================
 # Mocked API Fixtures
 # =============================================================================
@@ -316,3 +514,341 @@ def mock_notion_api_rate_limited(error_429_response):
             headers={"Retry-After": "30"}
         )
         yield rsps
+
+
+# =============================================================================
+# Shared Responses Mock
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def _responses_mock(request):
+    """
+    Start one HTTP mock for the whole session instead of one per test.
+
+    This is a RequestsMock by default, or a MockTransport when pytest runs
+    with --fast-mocks.
+    """
+    if request.config.getoption("--fast-mocks"):
+        mock = MockTransport()
+    else:
+        mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    with mock as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def mocked_responses(_responses_mock):
+    """Provide the session RequestsMock with an empty registry for this test."""
+    _responses_mock.reset()
+    yield _responses_mock
+
+
+# =============================================================================
+# /users/me Registration Fixtures
+# =============================================================================
+
+USERS_ME_URL = "https://api.notion.com/v1/users/me"
+
+
+@pytest.fixture
+def mock_users_me_success(mocked_responses, user_me_bot_body):
+    """Register a successful /users/me response."""
+    mocked_responses.add(
+        responses.GET,
+        USERS_ME_URL,
+        body=user_me_bot_body,
+        status=200,
+        content_type=JSON_CONTENT_TYPE
+    )
+
+
+@pytest.fixture
+def mock_users_me_401(mocked_responses, error_401_body):
+    """Register a 401 unauthorized /users/me response."""
+    mocked_responses.add(
+        responses.GET,
+        USERS_ME_URL,
+        body=error_401_body,
+        status=401,
+        content_type=JSON_CONTENT_TYPE
+    )
+
+
+@pytest.fixture
+def mock_users_me_403(mocked_responses, error_403_body):
+    """Register a 403 forbidden /users/me response."""
+    mocked_responses.add(
+        responses.GET,
+        USERS_ME_URL,
+        body=error_403_body,
+        status=403,
+        content_type=JSON_CONTENT_TYPE
+    )
+
+
+@pytest.fixture(
+    params=[(200, "bot_ok"), (401, "err_401"), (403, "err_403")],
+    ids=lambda param: param[1],
+)
+def mock_users_me(
+    request,
+    mocked_responses,
+    user_me_bot_body,
+    error_401_body,
+    error_403_body,
+) -> int:
+    """Register a /users/me response for each status variant and return its status code."""
+    status, _ = request.param
+    bodies = {
+        200: user_me_bot_body,
+        401: error_401_body,
+        403: error_403_body,
+    }
+    mocked_responses.add(
+        responses.GET,
+        USERS_ME_URL,
+        body=bodies[status],
+        status=status,
+        content_type=JSON_CONTENT_TYPE
+    )
+    return status
+
+
+# =============================================================================
+# Canned Transport Fixtures
+# =============================================================================
+
+
+class CannedResponseAdapter(HTTPAdapter):
+    """Transport adapter that answers every request with one prebuilt response."""
+
+    def __init__(self, response: requests.Response):
+        super().__init__()
+        self._response = response
+
+    def send(self, request, **kwargs) -> requests.Response:
+        self._response.request = request
+        self._response.url = request.url
+        return self._response
+
+
+def build_json_response(body: bytes, status: int = 200) -> requests.Response:
+    """Build a requests.Response carrying an already encoded JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response._content_consumed = True
+    response.headers["Content-Type"] = JSON_CONTENT_TYPE
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture(scope="session")
+def fast_notion_session(user_me_bot_body) -> requests.Session:
+    """
+    Session that answers every request with the /users/me bot response.
+
+    Assign it to NotionAuthenticator._session or NotionClient.session to skip
+    the responses registry for happy-path /users/me tests.
+    """
+    session = requests.Session()
+    adapter = CannedResponseAdapter(build_json_response(user_me_bot_body))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@pytest.fixture
+def canned_client_response(notion_client, monkeypatch):
+    """
+    Answer the shared client's HTTPS requests with one canned JSON response.
+
+    Call it with an encoded body (or a JSON-serializable payload) and a status
+    code; the adapter is swapped back out when the test finishes.
+    """
+    def _mount(body: Any, status: int = 200) -> None:
+        if not isinstance(body, bytes):
+            body = encode_json_body(body)
+        adapter = CannedResponseAdapter(build_json_response(body, status))
+        monkeypatch.setitem(notion_client.session.adapters, "https://", adapter)
+
+    return _mount
+
+
+class MockTransport:
+    """
+    In-memory replacement for HTTPAdapter.send, keyed by "METHOD /path" routes.
+
+    Used by mock_http, read_with_routes and --fast-mocks. Route values are an
+    encoded body, a JSON-serializable payload, a (status, body) tuple or an
+    exception to raise. Repeated registrations for a route are served in order
+    with the last one reused, like repeated responses.add() calls. A * in a
+    path matches one path segment (e.g. "GET /v1/blocks/*/children"); the
+    query string is ignored when matching.
+    """
+
+    def __init__(self, routes: Dict[str, Any] = None, latency: float = 0.0):
+        self.latency = latency
+        self._routes: Dict[str, List[Any]] = {}
+        self._patterns: List[Tuple[re.Pattern, str]] = []
+        self._patcher = patch.object(HTTPAdapter, "send", self.send)
+        for route, entries in (routes or {}).items():
+            for entry in entries if isinstance(entries, list) else [entries]:
+                self.add_route(route, entry)
+
+    def __enter__(self) -> "MockTransport":
+        self._patcher.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._patcher.stop()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every registered route."""
+        self._routes.clear()
+        self._patterns.clear()
+
+    def add_route(self, route: str, entry: Any) -> None:
+        """Append a response (or exception) to a "METHOD /path" route."""
+        if not isinstance(entry, Exception):
+            status, body = entry if isinstance(entry, tuple) else (200, entry)
+            if not isinstance(body, bytes):
+                body = encode_json_body(body)
+            entry = build_json_response(body, status)
+        self._append(route, entry)
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = b"",
+        json: Any = None,
+        status: int = 200,
+        content_type: str = JSON_CONTENT_TYPE,
+        headers: Dict[str, str] = None,
+    ) -> None:
+        """Register a response using the responses.add() signature subset the tests use."""
+        if isinstance(body, Exception):
+            entry = body
+        else:
+            if json is not None:
+                body = encode_json_body(json)
+            elif isinstance(body, str):
+                body = body.encode("utf-8")
+            entry = build_json_response(body, status)
+            entry.headers["Content-Type"] = content_type
+            entry.headers.update(headers or {})
+        self._append(f"{method} {urlsplit(url).path}", entry)
+
+    def _append(self, route: str, entry: Any) -> None:
+        if route not in self._routes:
+            self._routes[route] = []
+            if "*" in route:
+                pattern = "[^/]+".join(re.escape(part) for part in route.split("*"))
+                self._patterns.append((re.compile(pattern + r"\Z"), route))
+        self._routes[route].append(entry)
+
+    def _lookup(self, route: str) -> List[Any]:
+        entries = self._routes.get(route)
+        if entries is None:
+            for pattern, wildcard_route in self._patterns:
+                if pattern.match(route):
+                    return self._routes[wildcard_route]
+        return entries
+
+    def send(self, request, **kwargs) -> requests.Response:
+        route = f"{request.method} {urlsplit(request.url).path}"
+        entries = self._lookup(route)
+        if not entries:
+            raise requests.exceptions.ConnectionError(f"No mock route for {route}")
+        if self.latency:
+            time.sleep(self.latency)
+        entry = entries.pop(0) if len(entries) > 1 else entries[0]
+        if isinstance(entry, Exception):
+            raise entry
+        entry.request = request
+        entry.url = request.url
+        return entry
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """
+    Route every requests session through a MockTransport for one test.
+
+    Usage: mock_http({"GET /v1/users": users_list_response, ...}). Returns
+    the installed transport.
+    """
+    def _install(adapter_map: Dict[str, Any], latency: float = 0.0) -> MockTransport:
+        transport = MockTransport(adapter_map, latency=latency)
+        monkeypatch.setattr(HTTPAdapter, "send", transport.send)
+        return transport
+
+    return _install
+
+
+def read_with_routes(stream, routes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Read every full refresh record from a stream against in-memory routes."""
+    with MockTransport(routes):
+        return list(stream.read_records(sync_mode="full_refresh"))
+
+
+@pytest.fixture(scope="session")
+def users_stream_records(users_stream, users_list_body) -> List[Dict[str, Any]]:
+    """Records from one full refresh read of the users stream."""
+    return read_with_routes(users_stream, {"GET /v1/users": users_list_body})
+
+
+@pytest.fixture(scope="session")
+def users_by_type(users_stream_records) -> Dict[str, Dict[str, Any]]:
+    """First users stream record of each user type ("bot", "person")."""
+    by_type: Dict[str, Dict[str, Any]] = {}
+    for record in users_stream_records:
+        by_type.setdefault(record["type"], record)
+    return by_type
+
+
+@pytest.fixture(scope="session")
+def databases_stream_records(databases_stream, databases_list_body) -> List[Dict[str, Any]]:
+    """Records from one full refresh read of the databases stream."""
+    return read_with_routes(databases_stream, {"POST /v1/search": databases_list_body})
+
+
+@pytest.fixture(scope="session")
+def pages_stream_records(pages_stream, pages_list_body) -> List[Dict[str, Any]]:
+    """Records from one full refresh read of the pages stream."""
+    return read_with_routes(pages_stream, {"POST /v1/search": pages_list_body})
+
+
+@pytest.fixture(scope="session")
+def users_only_config(notion_config):
+    """NotionConfig with every stream except users disabled."""
+    return notion_config.model_copy(
+        update={
+            "sync_users": True,
+            "sync_databases": False,
+            "sync_pages": False,
+            "sync_blocks": False,
+            "sync_comments": False,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def users_only_connector(users_only_config):
+    """NotionSourceConnector that only syncs the users stream."""
+    from src.connector import NotionSourceConnector
+    return NotionSourceConnector(users_only_config)
+
+
+@pytest.fixture(scope="session")
+def users_only_read_messages(users_only_connector, users_list_body) -> List[Dict[str, Any]]:
+    """
+    Messages from one read() of a connector that only syncs users.
+
+    The read runs once per session against an in-memory /v1/users route and
+    the resulting message list is shared read-only.
+    """
+    with MockTransport({"GET /v1/users": users_list_body}):
+        return list(users_only_connector.read())
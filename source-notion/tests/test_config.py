@@ -2,15 +2,11 @@
 Configuration validation tests for Notion connector.
 """
 
-import sys
-from pathlib import Path
 from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 
 class TestTokenCredentials:
     """Test TokenCredentials model."""
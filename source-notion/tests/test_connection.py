@@ -2,32 +2,30 @@
 Connection check tests for Notion connector.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import re
 
 import pytest
+import requests
 import responses
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.auth import NotionAuthenticator
+from src.utils import NotionAuthenticationError
+
+# Case-insensitive matchers for the error messages surfaced to users
+AUTH_ERR = re.compile(r"invalid|unauthorized", re.I)
+FORBIDDEN_ERR = re.compile(r"forbidden", re.I)
+TIMEOUT_ERR = re.compile(r"timeout", re.I)
+CONNECT_ERR = re.compile(r"connect", re.I)
+PERMISSION_ERR = re.compile(r"permission", re.I)
 
 
 class TestNotionAuthenticator:
     """Test NotionAuthenticator class."""
 
-    @responses.activate
-    def test_validate_success(self, notion_config, user_me_bot_response):
+    def test_validate_success(self, notion_config, fast_notion_session):
         """Test successful authentication validation."""
-        from src.auth import NotionAuthenticator
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
         auth = NotionAuthenticator(notion_config)
+        auth._session = fast_notion_session
         result = auth.validate()
 
         assert result.success is True
@@ -36,52 +34,27 @@ class TestNotionAuthenticator:
         assert result.user_info["type"] == "bot"
         assert result.error is None
 
-    @responses.activate
-    def test_validate_invalid_token(self, notion_config, error_401_response):
+    def test_validate_invalid_token(self, notion_config, mock_users_me_401):
         """Test authentication validation with invalid token."""
-        from src.auth import NotionAuthenticator
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_401_response,
-            status=401
-        )
-
         auth = NotionAuthenticator(notion_config)
         result = auth.validate()
 
         assert result.success is False
         assert result.error is not None
-        assert "invalid" in result.error.lower() or "unauthorized" in result.error.lower()
+        assert AUTH_ERR.search(result.error)
 
-    @responses.activate
-    def test_validate_forbidden(self, notion_config, error_403_response):
+    def test_validate_forbidden(self, notion_config, mock_users_me_403):
         """Test authentication validation with forbidden error."""
-        from src.auth import NotionAuthenticator
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_403_response,
-            status=403
-        )
-
         auth = NotionAuthenticator(notion_config)
         result = auth.validate()
 
         assert result.success is False
         assert result.error is not None
-        assert "forbidden" in result.error.lower()
+        assert FORBIDDEN_ERR.search(result.error)
 
-    @responses.activate
-    def test_validate_connection_timeout(self, notion_config):
+    def test_validate_connection_timeout(self, mocked_responses, notion_config):
         """Test authentication validation with connection timeout."""
-        import requests
-
-        from src.auth import NotionAuthenticator
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users/me",
             body=requests.exceptions.Timeout()
@@ -91,16 +64,11 @@ class TestNotionAuthenticator:
         result = auth.validate()
 
         assert result.success is False
-        assert "timeout" in result.error.lower()
+        assert TIMEOUT_ERR.search(result.error)
 
-    @responses.activate
-    def test_validate_connection_error(self, notion_config):
+    def test_validate_connection_error(self, mocked_responses, notion_config):
         """Test authentication validation with connection error."""
-        import requests
-
-        from src.auth import NotionAuthenticator
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users/me",
             body=requests.exceptions.ConnectionError()
@@ -110,39 +78,19 @@ class TestNotionAuthenticator:
         result = auth.validate()
 
         assert result.success is False
-        assert "connect" in result.error.lower()
+        assert CONNECT_ERR.search(result.error)
 
-    @responses.activate
-    def test_validate_or_raise_success(self, notion_config, user_me_bot_response):
+    def test_validate_or_raise_success(self, notion_config, fast_notion_session):
         """Test validate_or_raise returns user info on success."""
-        from src.auth import NotionAuthenticator
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
         auth = NotionAuthenticator(notion_config)
+        auth._session = fast_notion_session
         user_info = auth.validate_or_raise()
 
         assert user_info is not None
         assert user_info["object"] == "user"
 
-    @responses.activate
-    def test_validate_or_raise_auth_failure(self, notion_config, error_401_response):
+    def test_validate_or_raise_auth_failure(self, notion_config, mock_users_me_401):
         """Test validate_or_raise raises exception on auth failure."""
-        from src.auth import NotionAuthenticator
-        from src.utils import NotionAuthenticationError
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_401_response,
-            status=401
-        )
-
         auth = NotionAuthenticator(notion_config)
 
         with pytest.raises(NotionAuthenticationError):
@@ -150,8 +98,6 @@ class TestNotionAuthenticator:
 
     def test_get_headers(self, notion_config):
         """Test get_headers returns correct headers."""
-        from src.auth import NotionAuthenticator
-
         auth = NotionAuthenticator(notion_config)
         headers = auth.get_headers()
 
@@ -162,41 +108,29 @@ class TestNotionAuthenticator:
 
     def test_is_authenticated_initial_false(self, notion_config):
         """Test is_authenticated is False initially."""
-        from src.auth import NotionAuthenticator
-
         auth = NotionAuthenticator(notion_config)
         assert auth.is_authenticated is False
 
-    @responses.activate
-    def test_is_authenticated_after_validate(self, notion_config, user_me_bot_response):
+    def test_is_authenticated_after_validate(self, notion_config, fast_notion_session):
         """Test is_authenticated is True after successful validation."""
-        from src.auth import NotionAuthenticator
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
         auth = NotionAuthenticator(notion_config)
+        auth._session = fast_notion_session
         auth.validate()
 
         assert auth.is_authenticated is True
 
-    @responses.activate
-    def test_bot_info_cached(self, notion_config, user_me_bot_response):
-        """Test bot info is cached after validation."""
-        from src.auth import NotionAuthenticator
+    def test_is_authenticated_matches_status(self, notion_config, mock_users_me):
+        """Test is_authenticated is only set when /users/me succeeds."""
+        auth = NotionAuthenticator(notion_config)
+        result = auth.validate()
 
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
+        assert result.success is (mock_users_me == 200)
+        assert auth.is_authenticated is (mock_users_me == 200)
 
+    def test_bot_info_cached(self, notion_config, fast_notion_session):
+        """Test bot info is cached after validation."""
         auth = NotionAuthenticator(notion_config)
+        auth._session = fast_notion_session
         auth.validate()
 
         assert auth.bot_info is not None
@@ -206,21 +140,20 @@ class TestNotionAuthenticator:
 class TestNotionSourceConnectorCheck:
     """Test NotionSourceConnector.check() method."""
 
-    @responses.activate
-    def test_check_success(self, notion_connector, user_me_bot_response, users_list_response):
+    def test_check_success(
+        self,
+        mocked_responses,
+        notion_connector,
+        mock_users_me_success,
+        users_list_body
+    ):
         """Test successful connection check."""
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
+            body=users_list_body,
+            status=200,
+            content_type="application/json"
         )
 
         result = notion_connector.check()
@@ -228,102 +161,88 @@ class TestNotionSourceConnectorCheck:
         assert result["type"] == "CONNECTION_STATUS"
         assert result["connectionStatus"]["status"] == "SUCCEEDED"
 
-    @responses.activate
-    def test_check_auth_failure(self, notion_connector, error_401_response):
+    def test_check_auth_failure(self, notion_connector, mock_users_me_401):
         """Test connection check with authentication failure."""
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_401_response,
-            status=401
-        )
-
         result = notion_connector.check()
 
         assert result["type"] == "CONNECTION_STATUS"
         assert result["connectionStatus"]["status"] == "FAILED"
         assert "message" in result["connectionStatus"]
 
-    @responses.activate
     def test_check_permission_failure(
         self,
+        mocked_responses,
         notion_connector,
-        user_me_bot_response,
-        error_403_response
+        mock_users_me_success,
+        error_403_body
     ):
         """Test connection check with permission failure."""
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users",
-            json=error_403_response,
-            status=403
+            body=error_403_body,
+            status=403,
+            content_type="application/json"
         )
 
         result = notion_connector.check()
 
         assert result["type"] == "CONNECTION_STATUS"
         assert result["connectionStatus"]["status"] == "FAILED"
-        assert "permission" in result["connectionStatus"]["message"].lower()
+        assert PERMISSION_ERR.search(result["connectionStatus"]["message"])
 
 
 class TestNotionClient:
     """Test NotionClient connection methods."""
 
-    @responses.activate
-    def test_client_check_connection_success(self, notion_config, user_me_bot_response):
+    def test_client_check_connection_success(
+        self,
+        mocked_responses,
+        notion_client,
+        user_me_bot_body
+    ):
         """Test client check_connection returns True on success."""
-        from src.client import NotionClient
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
+            body=user_me_bot_body,
+            status=200,
+            content_type="application/json"
         )
 
-        client = NotionClient(notion_config)
-        result = client.check_connection()
+        result = notion_client.check_connection()
 
         assert result is True
 
-    @responses.activate
-    def test_client_check_connection_failure(self, notion_config, error_401_response):
+    def test_client_check_connection_failure(
+        self,
+        mocked_responses,
+        notion_client,
+        error_401_body
+    ):
         """Test client check_connection returns False on failure."""
-        from src.client import NotionClient
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.notion.com/v1/users/me",
-            json=error_401_response,
-            status=401
+            body=error_401_body,
+            status=401,
+            content_type="application/json"
         )
 
-        client = NotionClient(notion_config)
-        result = client.check_connection()
+        result = notion_client.check_connection()
 
         assert result is False
 
-    @responses.activate
-    def test_client_get_me(self, notion_config, user_me_bot_response):
+    def test_client_get_me(
+        self,
+        monkeypatch,
+        notion_client,
+        user_me_bot_response,
+        fast_notion_session
+    ):
         """Test client get_me method."""
-        from src.client import NotionClient
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=user_me_bot_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        result = client.get_me()
+        monkeypatch.setattr(notion_client, "session", fast_notion_session)
+        result = notion_client.get_me()
 
         assert result["object"] == "user"
         assert result["type"] == "bot"
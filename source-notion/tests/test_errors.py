@@ -2,14 +2,24 @@
 Error handling tests for Notion connector.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+import requests
 import responses
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.client import RateLimiter, RetryHandler
+from src.utils import (
+    NotionAPIError,
+    NotionAuthenticationError,
+    NotionConfigurationError,
+    NotionConnectionError,
+    NotionNotFoundError,
+    NotionPermissionError,
+    NotionRateLimitError,
+    NotionValidationError,
+)
 
 
 class TestNotionAPIErrors:
@@ -17,8 +27,6 @@ class TestNotionAPIErrors:
 
     def test_notion_api_error(self):
         """Test base NotionAPIError."""
-        from src.utils import NotionAPIError
-
         error = NotionAPIError(
             status_code=500,
             code="internal_error",
@@ -33,28 +41,29 @@ class TestNotionAPIErrors:
         assert "[500]" in str(error)
         assert "req-123" in str(error)
 
-    def test_notion_api_error_is_retryable(self):
+    @pytest.mark.parametrize(
+        "status,code,expected",
+        [
+            # Retryable errors
+            (429, "rate_limited", True),
+            (500, "server_error", True),
+            (502, "bad_gateway", True),
+            (503, "unavailable", True),
+            (504, "timeout", True),
+            (409, "conflict", True),
+            # Non-retryable errors
+            (400, "bad_request", False),
+            (401, "unauthorized", False),
+            (403, "forbidden", False),
+            (404, "not_found", False),
+        ],
+    )
+    def test_notion_api_error_is_retryable(self, status, code, expected):
         """Test is_retryable property."""
-        from src.utils import NotionAPIError
-
-        # Retryable errors
-        assert NotionAPIError(429, "rate_limited", "").is_retryable is True
-        assert NotionAPIError(500, "server_error", "").is_retryable is True
-        assert NotionAPIError(502, "bad_gateway", "").is_retryable is True
-        assert NotionAPIError(503, "unavailable", "").is_retryable is True
-        assert NotionAPIError(504, "timeout", "").is_retryable is True
-        assert NotionAPIError(409, "conflict", "").is_retryable is True
-
-        # Non-retryable errors
-        assert NotionAPIError(400, "bad_request", "").is_retryable is False
-        assert NotionAPIError(401, "unauthorized", "").is_retryable is False
-        assert NotionAPIError(403, "forbidden", "").is_retryable is False
-        assert NotionAPIError(404, "not_found", "").is_retryable is False
+        assert NotionAPIError(status, code, "").is_retryable is expected
 
     def test_notion_authentication_error(self):
         """Test NotionAuthenticationError."""
-        from src.utils import NotionAuthenticationError
-
         error = NotionAuthenticationError(
             code="unauthorized",
             message="Invalid token"
@@ -65,8 +74,6 @@ class TestNotionAPIErrors:
 
     def test_notion_rate_limit_error(self):
         """Test NotionRateLimitError."""
-        from src.utils import NotionRateLimitError
-
         error = NotionRateLimitError(
             code="rate_limited",
             message="Rate limit exceeded",
@@ -79,8 +86,6 @@ class TestNotionAPIErrors:
 
     def test_notion_validation_error(self):
         """Test NotionValidationError."""
-        from src.utils import NotionValidationError
-
         error = NotionValidationError(
             code="validation_error",
             message="Invalid request"
@@ -90,8 +95,6 @@ class TestNotionAPIErrors:
 
     def test_notion_not_found_error(self):
         """Test NotionNotFoundError."""
-        from src.utils import NotionNotFoundError
-
         error = NotionNotFoundError(
             code="object_not_found",
             message="Page not found"
@@ -101,8 +104,6 @@ class TestNotionAPIErrors:
 
     def test_notion_permission_error(self):
         """Test NotionPermissionError."""
-        from src.utils import NotionPermissionError
-
         error = NotionPermissionError(
             code="restricted_resource",
             message="Access denied"
@@ -116,11 +117,7 @@ class TestNotionAPIErrorFromResponse:
 
     def test_from_response_401(self, error_401_response):
         """Test creating error from 401 response."""
-        from src.utils import NotionAPIError, NotionAuthenticationError
-
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.headers = {"x-request-id": "req-123"}
+        mock_response = Mock(status_code=401, headers={"x-request-id": "req-123"})
         mock_response.json.return_value = error_401_response
 
         error = NotionAPIError.from_response(mock_response)
@@ -131,11 +128,7 @@ class TestNotionAPIErrorFromResponse:
 
     def test_from_response_403(self, error_403_response):
         """Test creating error from 403 response."""
-        from src.utils import NotionAPIError, NotionPermissionError
-
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.headers = {"x-request-id": "req-123"}
+        mock_response = Mock(status_code=403, headers={"x-request-id": "req-123"})
         mock_response.json.return_value = error_403_response
 
         error = NotionAPIError.from_response(mock_response)
@@ -145,14 +138,10 @@ class TestNotionAPIErrorFromResponse:
 
     def test_from_response_429(self, error_429_response):
         """Test creating error from 429 response."""
-        from src.utils import NotionAPIError, NotionRateLimitError
-
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {
-            "x-request-id": "req-123",
-            "Retry-After": "30"
-        }
+        mock_response = Mock(
+            status_code=429,
+            headers={"x-request-id": "req-123", "Retry-After": "30"}
+        )
         mock_response.json.return_value = error_429_response
 
         error = NotionAPIError.from_response(mock_response)
@@ -165,52 +154,24 @@ class TestNotionAPIErrorFromResponse:
 class TestClientErrorHandling:
     """Test error handling in NotionClient."""
 
-    @responses.activate
-    def test_client_handles_401(self, notion_config, error_401_response):
+    def test_client_handles_401(self, notion_client, canned_client_response, error_401_body):
         """Test client raises error on 401."""
-        from src.client import NotionClient
-        from src.utils import NotionAuthenticationError
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_401_response,
-            status=401
-        )
-
-        client = NotionClient(notion_config)
+        canned_client_response(error_401_body, status=401)
 
         with pytest.raises(NotionAuthenticationError):
-            client.get_me()
+            notion_client.get_me()
 
-    @responses.activate
-    def test_client_handles_403(self, notion_config, error_403_response):
+    def test_client_handles_403(self, notion_client, canned_client_response, error_403_body):
         """Test client raises error on 403."""
-        from src.client import NotionClient
-        from src.utils import NotionPermissionError
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users/me",
-            json=error_403_response,
-            status=403
-        )
-
-        client = NotionClient(notion_config)
+        canned_client_response(error_403_body, status=403)
 
         with pytest.raises(NotionPermissionError):
-            client.get_me()
+            notion_client.get_me()
 
-    @responses.activate
-    def test_client_handles_404(self, notion_config):
+    def test_client_handles_404(self, notion_client, canned_client_response):
         """Test client raises error on 404."""
-        from src.client import NotionClient
-        from src.utils import NotionNotFoundError
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/pages/nonexistent",
-            json={
+        canned_client_response(
+            {
                 "object": "error",
                 "status": 404,
                 "code": "object_not_found",
@@ -219,21 +180,13 @@ class TestClientErrorHandling:
             status=404
         )
 
-        client = NotionClient(notion_config)
-
         with pytest.raises(NotionNotFoundError):
-            client.get_page("nonexistent")
+            notion_client.get_page("nonexistent")
 
-    @responses.activate
-    def test_client_handles_400(self, notion_config):
+    def test_client_handles_400(self, notion_client, canned_client_response):
         """Test client raises error on 400."""
-        from src.client import NotionClient
-        from src.utils import NotionValidationError
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json={
+        canned_client_response(
+            {
                 "object": "error",
                 "status": 400,
                 "code": "validation_error",
@@ -242,11 +195,9 @@ class TestClientErrorHandling:
             status=400
         )
 
-        client = NotionClient(notion_config)
-
         with pytest.raises(NotionValidationError):
             # Need to consume the generator
-            list(client.list_pages())
+            list(notion_client.list_pages())
 
 
 class TestRateLimiting:
@@ -254,8 +205,6 @@ class TestRateLimiting:
 
     def test_rate_limiter_initialization(self):
         """Test RateLimiter initialization."""
-        from src.client import RateLimiter
-
         limiter = RateLimiter(requests_per_second=3.0)
 
         assert limiter.requests_per_second == 3.0
@@ -263,8 +212,6 @@ class TestRateLimiting:
 
     def test_rate_limiter_reset(self):
         """Test RateLimiter reset."""
-        from src.client import RateLimiter
-
         limiter = RateLimiter()
         limiter._last_request_time = 100.0
         limiter.reset()
@@ -277,8 +224,6 @@ class TestRetryHandler:
 
     def test_retry_handler_initialization(self):
         """Test RetryHandler initialization."""
-        from src.client import RetryHandler
-
         handler = RetryHandler(
             max_retries=3,
             base_delay=2.0,
@@ -289,87 +234,67 @@ class TestRetryHandler:
         assert handler.base_delay == 2.0
         assert handler.max_delay == 30.0
 
-    def test_retry_handler_should_retry(self):
+    @pytest.mark.parametrize(
+        "status_code,expected",
+        [
+            (429, True),
+            (500, True),
+            (502, True),
+            (503, True),
+            (200, False),
+            (400, False),
+            (401, False),
+        ],
+    )
+    def test_retry_handler_should_retry(self, status_code, expected):
         """Test RetryHandler should_retry method."""
-        from src.client import RetryHandler
-
         handler = RetryHandler()
 
-        # Should retry
-        mock_response = Mock()
-        mock_response.status_code = 429
-        assert handler.should_retry(mock_response) is True
-
-        mock_response.status_code = 500
-        assert handler.should_retry(mock_response) is True
-
-        mock_response.status_code = 502
-        assert handler.should_retry(mock_response) is True
-
-        mock_response.status_code = 503
-        assert handler.should_retry(mock_response) is True
-
-        # Should not retry
-        mock_response.status_code = 200
-        assert handler.should_retry(mock_response) is False
-
-        mock_response.status_code = 400
-        assert handler.should_retry(mock_response) is False
+        assert handler.should_retry(SimpleNamespace(status_code=status_code)) is expected
 
-        mock_response.status_code = 401
-        assert handler.should_retry(mock_response) is False
-
-    def test_retry_handler_calculate_delay(self):
+    @pytest.mark.parametrize("attempt,expected", [(0, 1.0), (1, 2.0), (2, 4.0), (3, 8.0)])
+    def test_retry_handler_calculate_delay(self, attempt, expected):
         """Test RetryHandler calculate_delay with exponential backoff."""
-        from src.client import RetryHandler
-
         handler = RetryHandler(base_delay=1.0, max_delay=60.0)
 
         # Exponential backoff: base * 2^attempt
-        assert handler.calculate_delay(0) == 1.0  # 1.0 * 2^0 = 1.0
-        assert handler.calculate_delay(1) == 2.0  # 1.0 * 2^1 = 2.0
-        assert handler.calculate_delay(2) == 4.0  # 1.0 * 2^2 = 4.0
-        assert handler.calculate_delay(3) == 8.0  # 1.0 * 2^3 = 8.0
+        assert handler.calculate_delay(attempt) == expected
 
     def test_retry_handler_respects_max_delay(self):
         """Test RetryHandler respects max_delay."""
-        from src.client import RetryHandler
-
         handler = RetryHandler(base_delay=1.0, max_delay=10.0)
 
         # Should cap at max_delay
         assert handler.calculate_delay(10) == 10.0  # Would be 1024, capped at 10
 
-    def test_retry_handler_uses_retry_after(self):
+    @pytest.mark.parametrize(
+        "retry_after,expected",
+        [
+            (30.0, 30.0),  # Should use Retry-After value
+            (100.0, 60.0),  # But still cap at max_delay
+        ],
+    )
+    def test_retry_handler_uses_retry_after(self, retry_after, expected):
         """Test RetryHandler uses Retry-After header value."""
-        from src.client import RetryHandler
-
         handler = RetryHandler(base_delay=1.0, max_delay=60.0)
 
-        # Should use Retry-After value
-        assert handler.calculate_delay(0, retry_after=30.0) == 30.0
-
-        # But still cap at max_delay
-        assert handler.calculate_delay(0, retry_after=100.0) == 60.0
+        assert handler.calculate_delay(0, retry_after=retry_after) == expected
 
     def test_retry_handler_get_retry_after(self):
         """Test RetryHandler get_retry_after method."""
-        from src.client import RetryHandler
-
         handler = RetryHandler()
 
         # With Retry-After header
-        mock_response = Mock()
-        mock_response.headers = {"Retry-After": "30"}
-        assert handler.get_retry_after(mock_response) == 30.0
+        response = SimpleNamespace(headers={"Retry-After": "30"})
+        assert handler.get_retry_after(response) == 30.0
 
         # Without Retry-After header
-        mock_response.headers = {}
-        assert handler.get_retry_after(mock_response) is None
+        response.headers = {}
+        assert handler.get_retry_after(response) is None
 
         # Invalid Retry-After value
-        mock_response.headers = {"Retry-After": "invalid"}
-        assert handler.get_retry_after(mock_response) is None
+        response.headers = {"Retry-After": "invalid"}
+        assert handler.get_retry_after(response) is None
 
 
 class TestConnectionErrors:
@@ -377,58 +302,44 @@ class TestConnectionErrors:
 
     def test_notion_connection_error(self):
         """Test NotionConnectionError."""
-        from src.utils import NotionConnectionError
-
         error = NotionConnectionError("Failed to connect")
         assert str(error) == "Failed to connect"
 
     def test_notion_configuration_error(self):
         """Test NotionConfigurationError."""
-        from src.utils import NotionConfigurationError
-
         error = NotionConfigurationError("Invalid config")
         assert str(error) == "Invalid config"
 
-    @responses.activate
-    def test_client_handles_timeout(self, notion_config):
+    def test_client_handles_timeout(self, mocked_responses, notion_client, monkeypatch):
         """Test client handles connection timeout."""
-        import requests
-        from src.client import NotionClient
-        from src.utils import NotionConnectionError
-
-        # Simulate timeout - use multiple timeouts to exhaust retries
-        for _ in range(6):  # max_retries + 1
-            responses.add(
-                responses.GET,
-                "https://api.notion.com/v1/users/me",
-                body=requests.exceptions.Timeout()
-            )
-
-        client = NotionClient(notion_config)
+        # Retry every attempt without the backoff or rate limiter sleeps
+        monkeypatch.setattr(notion_client.retry_handler, "base_delay", 0)
+        monkeypatch.setattr(notion_client.rate_limiter, "min_interval", 0)
+        # Simulate timeout - one registration is reused for every retry
+        mocked_responses.add(
+            responses.GET,
+            "https://api.notion.com/v1/users/me",
+            body=requests.exceptions.Timeout()
+        )
 
         with pytest.raises(NotionConnectionError) as exc_info:
-            client.get_me()
+            notion_client.get_me()
 
-        assert "timed out" in str(exc_info.value).lower()
+        assert "timed out" in exc_info.value.args[0].lower()
 
-    @responses.activate
-    def test_client_handles_connection_error(self, notion_config):
+    def test_client_handles_connection_error(self, mocked_responses, notion_client, monkeypatch):
         """Test client handles connection error."""
-        import requests
-        from src.client import NotionClient
-        from src.utils import NotionConnectionError
-
-        # Simulate connection error - use multiple errors to exhaust retries
-        for _ in range(6):  # max_retries + 1
-            responses.add(
-                responses.GET,
-                "https://api.notion.com/v1/users/me",
-                body=requests.exceptions.ConnectionError()
-            )
-
-        client = NotionClient(notion_config)
+        # Retry every attempt without the backoff or rate limiter sleeps
+        monkeypatch.setattr(notion_client.retry_handler, "base_delay", 0)
+        monkeypatch.setattr(notion_client.rate_limiter, "min_interval", 0)
+        # Simulate connection error - one registration is reused for every retry
+        mocked_responses.add(
+            responses.GET,
+            "https://api.notion.com/v1/users/me",
+            body=requests.exceptions.ConnectionError()
+        )
 
         with pytest.raises(NotionConnectionError) as exc_info:
-            client.get_me()
+            notion_client.get_me()
 
-        assert "connect" in str(exc_info.value).lower()
+        assert "connect" in exc_info.value.args[0].lower()
@@ -2,44 +2,32 @@
 Data reading tests for Notion connector.
 """
 
-import json
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timezone
 
 import pytest
-import responses
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.connector import AirbyteMessage
+from src.streams import StreamState
+
+# Fixed timestamp for state round-trips, so no test reads the wall clock
+SENTINEL_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 class TestNotionClientReadMethods:
     """Test NotionClient data reading methods."""
 
-    @responses.activate
-    def test_list_users(self, notion_config, users_list_response):
+    def test_list_users(self, mock_http, notion_client, users_list_body):
         """Test listing users."""
-        from src.client import NotionClient
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
+        mock_http({"GET /v1/users": users_list_body})
 
-        client = NotionClient(notion_config)
-        users = list(client.list_users())
+        users = list(notion_client.list_users())
 
         assert len(users) == 3
         assert users[0]["type"] == "bot"
         assert users[1]["type"] == "person"
 
-    @responses.activate
-    def test_list_users_pagination(self, notion_config, users_list_response):
+    def test_list_users_pagination(self, mock_http, notion_client, users_list_response):
         """Test user listing with pagination."""
-        from src.client import NotionClient
-
         # First page
         page1 = {
             "object": "list",
@@ -56,136 +44,69 @@ class TestNotionClientReadMethods:
             "next_cursor": None
         }
 
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=page1,
-            status=200
-        )
+        mock_http({"GET /v1/users": [page1, page2]})
 
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=page2,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        users = list(client.list_users())
+        users = list(notion_client.list_users())
 
         assert len(users) == 3
 
-    @responses.activate
-    def test_get_user(self, notion_config, user_person_response):
+    def test_get_user(self, mock_http, notion_client, user_person_body):
         """Test getting a single user."""
-        from src.client import NotionClient
-
         user_id = "c23f7f2b-4a5e-5d6f-9a7b-8c9d0e1f2a3b"
 
-        responses.add(
-            responses.GET,
-            f"https://api.notion.com/v1/users/{user_id}",
-            json=user_person_response,
-            status=200
-        )
+        mock_http({f"GET /v1/users/{user_id}": user_person_body})
 
-        client = NotionClient(notion_config)
-        user = client.get_user(user_id)
+        user = notion_client.get_user(user_id)
 
         assert user["id"] == user_id
         assert user["type"] == "person"
 
-    @responses.activate
-    def test_list_databases(self, notion_config, databases_list_response):
+    def test_list_databases(self, mock_http, notion_client, databases_list_body):
         """Test listing databases via search."""
-        from src.client import NotionClient
+        mock_http({"POST /v1/search": databases_list_body})
 
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=databases_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        databases = list(client.list_databases())
+        databases = list(notion_client.list_databases())
 
         assert len(databases) == 2
         assert databases[0]["object"] == "database"
 
-    @responses.activate
-    def test_list_pages(self, notion_config, pages_list_response):
+    def test_list_pages(self, mock_http, notion_client, pages_list_body):
         """Test listing pages via search."""
-        from src.client import NotionClient
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=pages_list_response,
-            status=200
-        )
+        mock_http({"POST /v1/search": pages_list_body})
 
-        client = NotionClient(notion_config)
-        pages = list(client.list_pages())
+        pages = list(notion_client.list_pages())
 
         assert len(pages) == 2
         assert pages[0]["object"] == "page"
 
-    @responses.activate
-    def test_get_page(self, notion_config, page_full_response):
+    def test_get_page(self, mock_http, notion_client, page_full_body):
         """Test getting a single page."""
-        from src.client import NotionClient
-
         page_id = "e5f6a7b8-c9d0-1234-5678-90abcdef1234"
 
-        responses.add(
-            responses.GET,
-            f"https://api.notion.com/v1/pages/{page_id}",
-            json=page_full_response,
-            status=200
-        )
+        mock_http({f"GET /v1/pages/{page_id}": page_full_body})
 
-        client = NotionClient(notion_config)
-        page = client.get_page(page_id)
+        page = notion_client.get_page(page_id)
 
         assert page["object"] == "page"
 
-    @responses.activate
-    def test_list_block_children(self, notion_config, blocks_list_response):
+    def test_list_block_children(self, mock_http, notion_client, blocks_list_body):
         """Test listing block children."""
-        from src.client import NotionClient
-
         block_id = "e5f6a7b8-c9d0-1234-5678-90abcdef1234"
 
-        responses.add(
-            responses.GET,
-            f"https://api.notion.com/v1/blocks/{block_id}/children",
-            json=blocks_list_response,
-            status=200
-        )
+        mock_http({f"GET /v1/blocks/{block_id}/children": blocks_list_body})
 
-        client = NotionClient(notion_config)
-        blocks = list(client.list_block_children(block_id))
+        blocks = list(notion_client.list_block_children(block_id))
 
         assert len(blocks) >= 1
         assert all(b["object"] == "block" for b in blocks)
 
-    @responses.activate
-    def test_list_comments(self, notion_config, comments_list_response):
+    def test_list_comments(self, mock_http, notion_client, comments_list_body):
         """Test listing comments."""
-        from src.client import NotionClient
-
         block_id = "e5f6a7b8-c9d0-1234-5678-90abcdef1234"
 
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/comments",
-            json=comments_list_response,
-            status=200
-        )
+        mock_http({"GET /v1/comments": comments_list_body})
 
-        client = NotionClient(notion_config)
-        comments = list(client.list_comments(block_id=block_id))
+        comments = list(notion_client.list_comments(block_id=block_id))
 
         assert isinstance(comments, list)
 
@@ -193,97 +114,39 @@ class TestNotionClientReadMethods:
 class TestUsersStream:
     """Test UsersStream reading."""
 
-    @responses.activate
-    def test_read_records_full_refresh(self, notion_config, users_list_response):
+    def test_read_records_full_refresh(self, users_stream_records):
         """Test reading user records in full refresh mode."""
-        from src.streams import UsersStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = UsersStream(client, notion_config)
-
-        records = list(stream.read_records(sync_mode="full_refresh"))
+        records = users_stream_records
 
         assert len(records) == 3
         assert records[0]["id"] is not None
         assert records[0]["object"] == "user"
 
-    @responses.activate
-    def test_user_record_transformation(self, notion_config, users_list_response):
+    def test_user_record_transformation(self, users_by_type):
         """Test user record transformation."""
-        from src.streams import UsersStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = UsersStream(client, notion_config)
-
-        records = list(stream.read_records())
-
         # Check bot user
-        bot_user = next(r for r in records if r["type"] == "bot")
+        bot_user = users_by_type["bot"]
         assert bot_user["name"] == "Test Integration Bot"
         assert bot_user["bot"] is not None
 
         # Check person user
-        person_user = next(r for r in records if r["type"] == "person")
+        person_user = users_by_type["person"]
         assert person_user["email"] is not None
 
 
 class TestDatabasesStream:
     """Test DatabasesStream reading."""
 
-    @responses.activate
-    def test_read_records_full_refresh(self, notion_config, databases_list_response):
+    def test_read_records_full_refresh(self, databases_stream_records):
         """Test reading database records."""
-        from src.streams import DatabasesStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=databases_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = DatabasesStream(client, notion_config)
-
-        records = list(stream.read_records(sync_mode="full_refresh"))
+        records = databases_stream_records
 
         assert len(records) == 2
         assert all(r["object"] == "database" for r in records)
 
-    @responses.activate
-    def test_database_title_extraction(self, notion_config, databases_list_response):
+    def test_database_title_extraction(self, databases_stream_records):
         """Test database title extraction."""
-        from src.streams import DatabasesStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=databases_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = DatabasesStream(client, notion_config)
-
-        records = list(stream.read_records())
+        records = databases_stream_records
 
         assert records[0]["title"] == "Project Tasks"
         assert records[1]["title"] == "Customer Database"
@@ -292,44 +155,16 @@ class TestDatabasesStream:
 class TestPagesStream:
     """Test PagesStream reading."""
 
-    @responses.activate
-    def test_read_records_full_refresh(self, notion_config, pages_list_response):
+    def test_read_records_full_refresh(self, pages_stream_records):
         """Test reading page records."""
-        from src.streams import PagesStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=pages_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = PagesStream(client, notion_config)
-
-        records = list(stream.read_records(sync_mode="full_refresh"))
+        records = pages_stream_records
 
         assert len(records) == 2
         assert all(r["object"] == "page" for r in records)
 
-    @responses.activate
-    def test_page_title_extraction(self, notion_config, pages_list_response):
+    def test_page_title_extraction(self, pages_stream_records):
         """Test page title extraction."""
-        from src.streams import PagesStream
-        from src.client import NotionClient
-
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=pages_list_response,
-            status=200
-        )
-
-        client = NotionClient(notion_config)
-        stream = PagesStream(client, notion_config)
-
-        records = list(stream.read_records())
+        records = pages_stream_records
 
         assert records[0]["title"] == "Project Planning Document"
         assert records[1]["title"] == "Meeting Notes"
@@ -338,90 +173,35 @@ class TestPagesStream:
 class TestNotionSourceConnectorRead:
     """Test NotionSourceConnector.read() method."""
 
-    @responses.activate
     def test_read_yields_messages(
         self,
+        mock_http,
         notion_connector,
-        users_list_response,
-        databases_list_response,
-        pages_list_response,
-        blocks_list_response,
-        comments_list_response,
+        users_list_body,
+        databases_list_body,
+        pages_list_body,
+        blocks_list_body,
+        comments_list_body,
     ):
-        """Test that read yields proper messages."""
-        # Mock users endpoint
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
-
-        # Mock search for databases
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=databases_list_response,
-            status=200
-        )
-
-        # Mock search for pages
-        responses.add(
-            responses.POST,
-            "https://api.notion.com/v1/search",
-            json=pages_list_response,
-            status=200
-        )
-
-        # Mock blocks endpoint with regex
-        import re
-        responses.add_callback(
-            responses.GET,
-            re.compile(r"https://api\.notion\.com/v1/blocks/.+/children"),
-            callback=lambda req: (200, {}, json.dumps(blocks_list_response)),
-        )
-
-        # Mock comments endpoint
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/comments",
-            json=comments_list_response,
-            status=200
-        )
+        """Test that a full read of every enabled stream yields records."""
+        # The connector makes one request per page; skip the 3 req/s throttle
+        notion_connector.client.rate_limiter.min_interval = 0
+        mock_http({
+            "GET /v1/users": users_list_body,
+            # Search serves databases first, then pages
+            "POST /v1/search": [databases_list_body, pages_list_body],
+            "GET /v1/blocks/*/children": blocks_list_body,
+            "GET /v1/comments": comments_list_body,
+        })
 
         messages = list(notion_connector.read())
 
-        # Should have RECORD and STATE messages
-        message_types = [m["type"] for m in messages]
-        assert "RECORD" in message_types or "LOG" in message_types
+        record_streams = {m["record"]["stream"] for m in messages if m["type"] == "RECORD"}
+        assert record_streams == {"users", "databases", "pages", "blocks", "comments"}
 
-    @responses.activate
-    def test_read_record_message_format(self, notion_connector, users_list_response):
+    def test_read_record_message_format(self, users_only_read_messages):
         """Test RECORD message format."""
-        from src.config import NotionConfig
-        from src.connector import NotionSourceConnector
-
-        # Create connector that only syncs users
-        config = NotionConfig(
-            credentials=notion_connector.config.credentials.model_dump(),
-            sync_users=True,
-            sync_databases=False,
-            sync_pages=False,
-            sync_blocks=False,
-            sync_comments=False,
-        )
-        connector = NotionSourceConnector(config)
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
-
-        messages = list(connector.read())
-
-        record_messages = [m for m in messages if m["type"] == "RECORD"]
+        record_messages = [m for m in users_only_read_messages if m["type"] == "RECORD"]
 
         for msg in record_messages:
             assert "record" in msg
@@ -429,33 +209,9 @@ class TestNotionSourceConnectorRead:
             assert "data" in msg["record"]
             assert "emitted_at" in msg["record"]
 
-    @responses.activate
-    def test_read_state_message_format(self, notion_connector, users_list_response):
+    def test_read_state_message_format(self, users_only_read_messages):
         """Test STATE message format."""
-        from src.config import NotionConfig
-        from src.connector import NotionSourceConnector
-
-        # Create connector that only syncs users
-        config = NotionConfig(
-            credentials=notion_connector.config.credentials.model_dump(),
-            sync_users=True,
-            sync_databases=False,
-            sync_pages=False,
-            sync_blocks=False,
-            sync_comments=False,
-        )
-        connector = NotionSourceConnector(config)
-
-        responses.add(
-            responses.GET,
-            "https://api.notion.com/v1/users",
-            json=users_list_response,
-            status=200
-        )
-
-        messages = list(connector.read())
-
-        state_messages = [m for m in messages if m["type"] == "STATE"]
+        state_messages = [m for m in users_only_read_messages if m["type"] == "STATE"]
 
         for msg in state_messages:
             assert "state" in msg
@@ -465,22 +221,20 @@ class TestNotionSourceConnectorRead:
 class TestStreamState:
     """Test StreamState class."""
 
-    def test_stream_state_initialization(self):
+    @pytest.mark.parametrize(
+        "init,expected",
+        [
+            (None, {}),  # Empty state
+            ({"key": "value"}, {"key": "value"}),  # With initial data
+        ],
+    )
+    def test_stream_state_initialization(self, init, expected):
         """Test StreamState initialization."""
-        from src.streams import StreamState
-
-        # Empty state
-        state = StreamState()
-        assert state.to_dict() == {}
-
-        # With initial data
-        state = StreamState({"key": "value"})
-        assert state.get("key") == "value"
+        state = StreamState(init)
+        assert state.to_dict() == expected
 
     def test_stream_state_get_set(self):
         """Test StreamState get and set methods."""
-        from src.streams import StreamState
-
         state = StreamState()
 
         state.set("cursor", "abc123")
@@ -489,20 +243,15 @@ class TestStreamState:
 
     def test_stream_state_last_sync_time(self):
         """Test StreamState last sync time methods."""
-        from datetime import datetime, timezone
-        from src.streams import StreamState
-
         state = StreamState()
 
         # Initially None
         assert state.get_last_sync_time() is None
 
         # Set and get
-        now = datetime.now(timezone.utc)
-        state.set_last_sync_time(now)
+        state.set_last_sync_time(SENTINEL_TS)
 
-        retrieved = state.get_last_sync_time()
-        assert retrieved is not None
+        assert state.get_last_sync_time() == SENTINEL_TS
 
 
 class TestAirbyteMessage:
@@ -510,8 +259,6 @@ class TestAirbyteMessage:
 
     def test_log_message(self):
         """Test log message format."""
-        from src.connector import AirbyteMessage
-
         msg = AirbyteMessage.log("INFO", "Test message")
 
         assert msg["type"] == "LOG"
@@ -520,8 +267,6 @@ class TestAirbyteMessage:
 
     def test_connection_status_message(self):
         """Test connection status message format."""
-        from src.connector import AirbyteMessage
-
         msg = AirbyteMessage.connection_status("SUCCEEDED", "Connected successfully")
 
         assert msg["type"] == "CONNECTION_STATUS"
@@ -530,8 +275,6 @@ class TestAirbyteMessage:
 
     def test_record_message(self):
         """Test record message format."""
-        from src.connector import AirbyteMessage
-
         msg = AirbyteMessage.record("users", {"id": "123", "name": "Test"})
 
         assert msg["type"] == "RECORD"
@@ -541,8 +284,6 @@ class TestAirbyteMessage:
 
     def test_state_message(self):
         """Test state message format."""
-        from src.connector import AirbyteMessage
-
         msg = AirbyteMessage.state({"users": {"cursor": "abc"}})
 
         assert msg["type"] == "STATE"
@@ -550,8 +291,6 @@ class TestAirbyteMessage:
 
     def test_catalog_message(self):
         """Test catalog message format."""
-        from src.connector import AirbyteMessage
-
         catalog = {"streams": [{"name": "users"}]}
         msg = AirbyteMessage.catalog(catalog)
 
@@ -2,10 +2,8 @@
 Syntax validation tests for Notion connector source files.
 """
 
-import ast
-import py_compile
-import sys
 from pathlib import Path
+from typing import Dict
 
 import pytest
 
@@ -13,6 +11,19 @@ import pytest
 SRC_DIR = Path(__file__).parent.parent / "src"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _src_paths() -> Dict[str, Path]:
+    """Resolve the source file paths once, checking the src directory exists."""
+    assert SRC_DIR.is_dir(), f"Source directory {SRC_DIR} does not exist"
+    return {name: SRC_DIR / name for name in TestSyntaxValidation.SOURCE_FILES}
+
+
+@pytest.fixture(scope="session")
+def src_files(_src_paths: Dict[str, Path]) -> Dict[str, bytes]:
+    """Read each existing source file once per session."""
+    return {name: path.read_bytes() for name, path in _src_paths.items() if path.is_file()}
+
+
 class TestSyntaxValidation:
     """Test that all Python source files have valid syntax."""
 
@@ -27,42 +38,16 @@ class TestSyntaxValidation:
     ]
 
     @pytest.mark.parametrize("filename", SOURCE_FILES)
-    def test_source_file_syntax(self, filename: str):
+    def test_source_syntax(self, filename: str, src_files: Dict[str, bytes]):
         """Test that source file has valid Python syntax."""
-        filepath = SRC_DIR / filename
-        assert filepath.exists(), f"Source file {filename} does not exist"
-
-        # Try to compile the file
-        try:
-            py_compile.compile(str(filepath), doraise=True)
-        except py_compile.PyCompileError as e:
-            pytest.fail(f"Syntax error in {filename}: {e}")
-
-    @pytest.mark.parametrize("filename", SOURCE_FILES)
-    def test_source_file_parseable(self, filename: str):
-        """Test that source file is parseable as AST."""
-        filepath = SRC_DIR / filename
-        assert filepath.exists(), f"Source file {filename} does not exist"
-
-        with open(filepath, "r") as f:
-            source = f.read()
-
+        if filename not in src_files:
+            pytest.fail(f"Missing source file: {filename}")
         try:
-            ast.parse(source, filename=filename)
+            compile(src_files[filename], filename, "exec", dont_inherit=True)
         except SyntaxError as e:
-            pytest.fail(f"AST parse error in {filename}: {e}")
+            pytest.fail(f"Syntax error in {filename}: {e}")
 
-    def test_all_source_files_exist(self):
+    def test_all_source_files_exist(self, src_files: Dict[str, bytes]):
         """Test that all expected source files exist."""
-        missing = []
-        for filename in self.SOURCE_FILES:
-            filepath = SRC_DIR / filename
-            if not filepath.exists():
-                missing.append(filename)
-
+        missing = [name for name in self.SOURCE_FILES if name not in src_files]
         assert not missing, f"Missing source files: {missing}"
-
-    def test_source_directory_exists(self):
-        """Test that the src directory exists."""
-        assert SRC_DIR.exists(), f"Source directory {SRC_DIR} does not exist"
-        assert SRC_DIR.is_dir(), f"{SRC_DIR} is not a directory"
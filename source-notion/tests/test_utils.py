@@ -2,13 +2,53 @@
 Utility function tests for Notion connector.
 """
 
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.utils import (
+    build_filter_condition,
+    chunk_list,
+    extract_plain_text,
+    extract_property_value,
+    extract_title,
+    flatten_properties,
+    format_datetime_for_api,
+    format_notion_id,
+    normalize_notion_id,
+    parse_iso_datetime,
+    safe_get_nested,
+)
+
+
+# (property payload, expected extracted value)
+PROPERTY_CASES = [
+    ({"type": "title", "title": [{"plain_text": "My Title"}]}, "My Title"),
+    ({"type": "rich_text", "rich_text": [{"plain_text": "Some text"}]}, "Some text"),
+    # Empty and null rich text spans
+    ({"type": "rich_text", "rich_text": []}, ""),
+    ({"type": "title", "title": None}, ""),
+    ({"type": "number", "number": 42}, 42),
+    ({"type": "select", "select": {"name": "Option A"}}, "Option A"),
+    # Empty select
+    ({"type": "select", "select": None}, None),
+    (
+        {"type": "multi_select", "multi_select": [{"name": "Tag A"}, {"name": "Tag B"}]},
+        ["Tag A", "Tag B"],
+    ),
+    ({"type": "checkbox", "checkbox": True}, True),
+    ({"type": "url", "url": "https://example.com"}, "https://example.com"),
+    ({"type": "email", "email": "test@example.com"}, "test@example.com"),
+    ({"type": "phone_number", "phone_number": "+1-555-1234"}, "+1-555-1234"),
+    (
+        {"type": "date", "date": {"start": "2024-01-15", "end": "2024-01-20", "time_zone": "UTC"}},
+        {"start": "2024-01-15", "end": "2024-01-20", "time_zone": "UTC"},
+    ),
+    ({"type": "people", "people": [{"id": "user-1"}, {"id": "user-2"}]}, ["user-1", "user-2"]),
+    ({"type": "relation", "relation": [{"id": "page-1"}, {"id": "page-2"}]}, ["page-1", "page-2"]),
+    ({"type": "status", "status": {"name": "In Progress"}}, "In Progress"),
+]
+PROPERTY_CASE_IDS = [prop["type"] for prop, _ in PROPERTY_CASES]
 
 
 class TestDateTimeUtils:
@@ -16,8 +56,6 @@ class TestDateTimeUtils:
 
     def test_parse_iso_datetime_with_z(self):
         """Test parsing ISO datetime with Z suffix."""
-        from src.utils import parse_iso_datetime
-
         result = parse_iso_datetime("2024-01-15T10:30:00.000Z")
 
         assert result is not None
@@ -29,40 +67,41 @@ class TestDateTimeUtils:
 
     def test_parse_iso_datetime_with_offset(self):
         """Test parsing ISO datetime with timezone offset."""
-        from src.utils import parse_iso_datetime
-
         result = parse_iso_datetime("2024-01-15T10:30:00+00:00")
 
         assert result is not None
         assert result.year == 2024
 
+    def test_parse_iso_datetime_uneven_fraction(self):
+        """Test parsing a timestamp whose fraction is not 3 or 6 digits."""
+        result = parse_iso_datetime("2024-01-15T10:30:00.12345Z")
+
+        assert result == datetime(2024, 1, 15, 10, 30, 0, 123450, tzinfo=timezone.utc)
+
+    def test_parse_iso_datetime_invalid(self):
+        """Test parsing an unrecognized string returns None."""
+        assert parse_iso_datetime("not a date") is None
+
     def test_parse_iso_datetime_date_only(self):
         """Test parsing date-only string."""
-        from src.utils import parse_iso_datetime
-
         result = parse_iso_datetime("2024-01-15")
 
         assert result is not None
         assert result.year == 2024
         assert result.month == 1
         assert result.day == 15
+        assert result.tzinfo == timezone.utc
 
     def test_parse_iso_datetime_none(self):
         """Test parsing None returns None."""
-        from src.utils import parse_iso_datetime
-
         assert parse_iso_datetime(None) is None
 
     def test_parse_iso_datetime_empty(self):
         """Test parsing empty string returns None."""
-        from src.utils import parse_iso_datetime
-
         assert parse_iso_datetime("") is None
 
     def test_format_datetime_for_api(self):
         """Test formatting datetime for API."""
-        from src.utils import format_datetime_for_api
-
         dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
         result = format_datetime_for_api(dt)
 
@@ -72,14 +111,10 @@ class TestDateTimeUtils:
 
     def test_format_datetime_for_api_none(self):
         """Test formatting None returns None."""
-        from src.utils import format_datetime_for_api
-
         assert format_datetime_for_api(None) is None
 
     def test_format_datetime_adds_timezone(self):
         """Test formatting adds UTC timezone if missing."""
-        from src.utils import format_datetime_for_api
-
         dt = datetime(2024, 1, 15, 10, 30, 0)  # No timezone
         result = format_datetime_for_api(dt)
 
@@ -92,8 +127,6 @@ class TestTextExtractionUtils:
 
     def test_extract_plain_text(self):
         """Test extracting plain text from rich text array."""
-        from src.utils import extract_plain_text
-
         rich_text = [
             {"plain_text": "Hello "},
             {"plain_text": "World"}
@@ -104,15 +137,11 @@ class TestTextExtractionUtils:
 
     def test_extract_plain_text_empty(self):
         """Test extracting from empty array."""
-        from src.utils import extract_plain_text
-
         assert extract_plain_text([]) == ""
         assert extract_plain_text(None) == ""
 
     def test_extract_title(self):
         """Test extracting title from title property."""
-        from src.utils import extract_title
-
         title_property = [
             {"plain_text": "My Document"}
         ]
@@ -126,8 +155,6 @@ class TestNotionIdUtils:
 
     def test_normalize_notion_id(self):
         """Test normalizing Notion ID by removing dashes."""
-        from src.utils import normalize_notion_id
-
         # ID with dashes
         result = normalize_notion_id("12345678-1234-1234-1234-123456789012")
         assert result == "12345678123412341234123456789012"
@@ -138,8 +165,6 @@ class TestNotionIdUtils:
 
     def test_format_notion_id(self):
         """Test formatting Notion ID with dashes."""
-        from src.utils import format_notion_id
-
         # ID without dashes
         result = format_notion_id("12345678123412341234123456789012")
         assert result == "12345678-1234-1234-1234-123456789012"
@@ -150,8 +175,6 @@ class TestNotionIdUtils:
 
     def test_format_notion_id_non_standard_length(self):
         """Test formatting ID with non-standard length."""
-        from src.utils import format_notion_id
-
         # Should return as-is if not 32 chars
         result = format_notion_id("short")
         assert result == "short"
@@ -160,192 +183,13 @@ class TestNotionIdUtils:
 class TestPropertyExtractionUtils:
     """Test property extraction utility functions."""
 
-    def test_extract_property_value_title(self):
-        """Test extracting title property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "title",
-            "title": [{"plain_text": "My Title"}]
-        }
-
-        result = extract_property_value(prop)
-        assert result == "My Title"
-
-    def test_extract_property_value_rich_text(self):
-        """Test extracting rich_text property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "rich_text",
-            "rich_text": [{"plain_text": "Some text"}]
-        }
-
-        result = extract_property_value(prop)
-        assert result == "Some text"
-
-    def test_extract_property_value_number(self):
-        """Test extracting number property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "number",
-            "number": 42
-        }
-
-        result = extract_property_value(prop)
-        assert result == 42
-
-    def test_extract_property_value_select(self):
-        """Test extracting select property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "select",
-            "select": {"name": "Option A"}
-        }
-
-        result = extract_property_value(prop)
-        assert result == "Option A"
-
-    def test_extract_property_value_select_none(self):
-        """Test extracting empty select property."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "select",
-            "select": None
-        }
-
-        result = extract_property_value(prop)
-        assert result is None
-
-    def test_extract_property_value_multi_select(self):
-        """Test extracting multi_select property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "multi_select",
-            "multi_select": [
-                {"name": "Tag A"},
-                {"name": "Tag B"}
-            ]
-        }
-
-        result = extract_property_value(prop)
-        assert result == ["Tag A", "Tag B"]
-
-    def test_extract_property_value_checkbox(self):
-        """Test extracting checkbox property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "checkbox",
-            "checkbox": True
-        }
-
-        result = extract_property_value(prop)
-        assert result is True
-
-    def test_extract_property_value_url(self):
-        """Test extracting url property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "url",
-            "url": "https://example.com"
-        }
-
-        result = extract_property_value(prop)
-        assert result == "https://example.com"
-
-    def test_extract_property_value_email(self):
-        """Test extracting email property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "email",
-            "email": "test@example.com"
-        }
-
-        result = extract_property_value(prop)
-        assert result == "test@example.com"
-
-    def test_extract_property_value_phone_number(self):
-        """Test extracting phone_number property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "phone_number",
-            "phone_number": "+1-555-1234"
-        }
-
-        result = extract_property_value(prop)
-        assert result == "+1-555-1234"
-
-    def test_extract_property_value_date(self):
-        """Test extracting date property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "date",
-            "date": {
-                "start": "2024-01-15",
-                "end": "2024-01-20",
-                "time_zone": "UTC"
-            }
-        }
-
-        result = extract_property_value(prop)
-        assert result["start"] == "2024-01-15"
-        assert result["end"] == "2024-01-20"
-
-    def test_extract_property_value_people(self):
-        """Test extracting people property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "people",
-            "people": [
-                {"id": "user-1"},
-                {"id": "user-2"}
-            ]
-        }
-
-        result = extract_property_value(prop)
-        assert result == ["user-1", "user-2"]
-
-    def test_extract_property_value_relation(self):
-        """Test extracting relation property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "relation",
-            "relation": [
-                {"id": "page-1"},
-                {"id": "page-2"}
-            ]
-        }
-
-        result = extract_property_value(prop)
-        assert result == ["page-1", "page-2"]
-
-    def test_extract_property_value_status(self):
-        """Test extracting status property value."""
-        from src.utils import extract_property_value
-
-        prop = {
-            "type": "status",
-            "status": {"name": "In Progress"}
-        }
-
-        result = extract_property_value(prop)
-        assert result == "In Progress"
+    @pytest.mark.parametrize("prop,expected", PROPERTY_CASES, ids=PROPERTY_CASE_IDS)
+    def test_extract_property_value(self, prop, expected):
+        """Test extracting each supported property type."""
+        assert extract_property_value(prop) == expected
 
     def test_extract_property_value_none(self):
         """Test extracting from None returns None."""
-        from src.utils import extract_property_value
-
         assert extract_property_value(None) is None
         assert extract_property_value({}) is None
 
@@ -355,8 +199,6 @@ class TestFlattenProperties:
 
     def test_flatten_properties(self):
         """Test flattening Notion properties."""
-        from src.utils import flatten_properties
-
         properties = {
             "Name": {
                 "type": "title",
@@ -378,10 +220,15 @@ class TestFlattenProperties:
         assert result["Status"] == "Active"
         assert result["Count"] == 5
 
+    @pytest.mark.parametrize("prop,expected", PROPERTY_CASES, ids=PROPERTY_CASE_IDS)
+    def test_flatten_properties_matches_extract(self, prop, expected):
+        """Test flatten_properties agrees with extract_property_value for every type."""
+        flattened = flatten_properties({"p": prop})["p"]
+        assert flattened == extract_property_value(prop)
+        assert flattened == expected
+
     def test_flatten_properties_empty(self):
         """Test flattening empty properties."""
-        from src.utils import flatten_properties
-
         result = flatten_properties({})
         assert result == {}
 
@@ -391,8 +238,6 @@ class TestHelperFunctions:
 
     def test_build_filter_condition(self):
         """Test building filter condition."""
-        from src.utils import build_filter_condition
-
         result = build_filter_condition(
             property_name="Status",
             property_type="select",
@@ -405,8 +250,6 @@ class TestHelperFunctions:
 
     def test_chunk_list(self):
         """Test chunking a list."""
-        from src.utils import chunk_list
-
         items = [1, 2, 3, 4, 5, 6, 7]
         chunks = chunk_list(items, 3)
 
@@ -417,15 +260,17 @@ class TestHelperFunctions:
 
     def test_chunk_list_empty(self):
         """Test chunking empty list."""
-        from src.utils import chunk_list
-
         chunks = chunk_list([], 3)
         assert chunks == []
 
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_chunk_list_rejects_non_positive_size(self, chunk_size):
+        """Test chunking with a non-positive chunk size raises instead of dropping items."""
+        with pytest.raises(ValueError):
+            chunk_list([1, 2, 3], chunk_size)
+
     def test_safe_get_nested(self):
         """Test safely getting nested values."""
-        from src.utils import safe_get_nested
-
         data = {
             "level1": {
                 "level2": {
@@ -440,8 +285,6 @@ class TestHelperFunctions:
 
     def test_safe_get_nested_none_in_path(self):
         """Test safe_get_nested with None in path."""
-        from src.utils import safe_get_nested
-
         data = {
             "level1": None
         }